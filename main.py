@@ -1,14 +1,25 @@
 """Hybrid MCP + FastAPI server exposing a resume parsing tool."""
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
+from contextlib import asynccontextmanager
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+import orjson
+import simdjson
 import uvicorn
 
 try:
@@ -31,21 +42,25 @@ if not logger.handlers:
     logging.basicConfig(level=logging.INFO)
 
 
+# One ``KEY=value`` assignment per line; comments, blank lines and anything
+# without a valid identifier before ``=`` simply don't match.
+_ENV_LINE_RE = re.compile(
+    rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+
 def _load_env_file() -> None:
     env_path = Path(__file__).resolve().parent / ".env"
-    if not env_path.exists():
-        return
     try:
-        for raw_line in env_path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            cleaned = value.strip().strip('"').strip("'")
-            os.environ.setdefault(key.strip(), cleaned)
+        with open(env_path, "rb") as env_file:
+            data = env_file.read()
+        for match in _ENV_LINE_RE.finditer(data):
+            key, value = match.groups()
+            cleaned = value.strip(b'"').strip(b"'")
+            os.environ.setdefault(key.decode(), cleaned.decode())
         logger.info("Loaded environment variables from %s", env_path)
+    except FileNotFoundError:
+        return
     except Exception as exc:
         logger.warning("Failed to load .env file %s: %s", env_path, exc)
 
@@ -54,34 +69,113 @@ _load_env_file()
 
 
 def _safe_json_loads(data: str) -> Any:
+    try:
+        return orjson.loads(data if isinstance(data, (bytes, bytearray)) else data.encode())
+    except Exception:
+        pass
+    # orjson rejects some inputs stdlib json tolerates (e.g. lone surrogates).
     try:
         return json.loads(data)
     except Exception:
         return None
 
 
-def _find_text_payload(obj: Dict[str, Any]) -> Optional[str]:
-    """Search for a likely free-form resume text payload within a dict."""
-    text_keys = ("raw_text", "text", "resume", "content")
-    for key in text_keys:
-        value = obj.get(key)
-        if isinstance(value, str) and value.strip():
-            return value
-        if isinstance(value, dict):
-            nested = _find_text_payload(value)
-            if nested:
-                return nested
-        if isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    nested = _find_text_payload(item)
-                    if nested:
-                        return nested
-                elif isinstance(item, str) and item.strip():
-                    return item
+# Reused across calls: simdjson's parser keeps its internal buffers between
+# documents. Parsed documents are lazy proxies (``simdjson.Object`` /
+# ``simdjson.Array``) that only become Python objects when touched. The REST
+# route parses on the event loop, but parse_resume is a plain sync MCP tool
+# that the MCP runtime (or any code importing this module) may call from
+# other threads. A parser is not thread-safe, so each thread gets its own.
+_SIMD_LOCAL = threading.local()
+_MAPPING_TYPES = (dict, simdjson.Object)
+_SEQUENCE_TYPES = (list, simdjson.Array)
+
+
+def _simd_parser() -> simdjson.Parser:
+    parser = getattr(_SIMD_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMD_LOCAL.parser = simdjson.Parser()
+    return parser
+
+
+# simdjson reports both parse limits and parser misuse as RuntimeError;
+# only the misuse ("Tried to re-use a parser while ...") is a bug of ours.
+_SIMD_REUSE_MESSAGE = "re-use a parser"
+
+
+def _lazy_json_loads(data: str) -> Any:
+    """Parse JSON lazily with simdjson, falling back to ``_safe_json_loads``.
+
+    The returned document borrows this thread's parser: while any
+    ``simdjson.Object``/``Array`` from an earlier call is still referenced,
+    the next call raises ``RuntimeError``, so don't keep documents around.
+    Any other parse error takes the fallback, including the ``RuntimeError``s
+    simdjson raises for valid JSON it can't represent (``BIGINT_ERROR``,
+    ``DEPTH_ERROR``).
+    """
+    try:
+        return _simd_parser().parse(data.encode())
+    except ValueError:
+        return _safe_json_loads(data)
+    except RuntimeError as exc:
+        if _SIMD_REUSE_MESSAGE in str(exc):
+            raise
+        return _safe_json_loads(data)
+
+
+_TEXT_KEYS = ("raw_text", "text", "resume", "content")
+
+
+def _find_text_payload(obj: Any) -> Optional[str]:
+    """Search for a likely free-form resume text payload within a mapping.
+
+    Depth-first over ``_TEXT_KEYS`` (in order) using an explicit stack, so
+    deeply nested payloads don't cost a Python frame per level.
+    """
+    stack: List[Any] = [obj]
+    while stack:
+        current = stack.pop()
+        if type(current) is str:
+            if current.strip():
+                return current
+            continue
+        children: List[Any] = []
+        for key in _TEXT_KEYS:
+            value = current.get(key)
+            if type(value) is str:
+                if not children and value.strip():
+                    return value
+                children.append(value)
+            elif isinstance(value, _MAPPING_TYPES):
+                children.append(value)
+            elif isinstance(value, _SEQUENCE_TYPES):
+                children.extend(
+                    item for item in value
+                    if type(item) is str or isinstance(item, _MAPPING_TYPES)
+                )
+        # Reversed so the first child is popped (and searched) first.
+        stack.extend(reversed(children))
     return None
 
 
+def _fields_getter(*keys: str) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Return a getter for ``keys`` that yields ``""`` for missing keys."""
+    fast = itemgetter(*keys)
+
+    def get(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        try:
+            return fast(entry)
+        except KeyError:
+            return tuple(entry.get(key, "") for key in keys)
+
+    return get
+
+
+_EXP_GET = _fields_getter("company", "role", "years")
+_EDU_GET = _fields_getter("degree", "institution", "years")
+_PROJ_GET = _fields_getter("name", "description", "tech")
+
+
 def _ensure_shape(obj: Dict[str, Any]) -> Dict[str, Any]:
     output: Dict[str, Any] = {
         "name": obj.get("name") or "",
@@ -94,79 +188,298 @@ def _ensure_shape(obj: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(output["skills"], list):
         output["skills"] = []
     else:
-        output["skills"] = [str(skill) for skill in output["skills"]]
-
-    normalized_exp: List[Dict[str, str]] = []
-    for exp in output["experience"]:
-        if isinstance(exp, dict):
-            normalized_exp.append({
-                "company": str(exp.get("company", "")),
-                "role": str(exp.get("role", "")),
-                "years": str(exp.get("years", "")),
-            })
-    output["experience"] = normalized_exp
-
-    normalized_edu: List[Dict[str, str]] = []
-    for edu in output["education"]:
-        if isinstance(edu, dict):
-            normalized_edu.append({
-                "degree": str(edu.get("degree", "")),
-                "institution": str(edu.get("institution", "")),
-                "years": str(edu.get("years", "")),
-            })
-    output["education"] = normalized_edu
-
-    normalized_projects: List[Dict[str, Any]] = []
-    for proj in output["projects"]:
-        if isinstance(proj, dict):
-            tech = proj.get("tech") or []
-            if not isinstance(tech, list):
-                tech = []
-            normalized_projects.append({
-                "name": str(proj.get("name", "")),
-                "description": str(proj.get("description", "")),
-                "tech": [str(t) for t in tech],
-            })
-    output["projects"] = normalized_projects
+        output["skills"] = list(map(str, output["skills"]))
+
+    output["experience"] = [
+        {"company": str(company), "role": str(role), "years": str(years)}
+        for company, role, years in map(
+            _EXP_GET, (exp for exp in output["experience"] if isinstance(exp, dict))
+        )
+    ]
+
+    output["education"] = [
+        {"degree": str(degree), "institution": str(institution), "years": str(years)}
+        for degree, institution, years in map(
+            _EDU_GET, (edu for edu in output["education"] if isinstance(edu, dict))
+        )
+    ]
+
+    output["projects"] = [
+        {
+            "name": str(name),
+            "description": str(description),
+            "tech": list(map(str, tech)) if isinstance(tech, list) else [],
+        }
+        for name, description, tech in map(
+            _PROJ_GET, (proj for proj in output["projects"] if isinstance(proj, dict))
+        )
+    ]
 
     return output
 
 
-def _call_gemini(raw_text: str) -> Dict[str, Any]:
+# The prompt never changes between requests, so build it once at import.
+_SCHEMA_HINT_JSON = orjson.dumps({
+    "name": "John Doe",
+    "email": "john@example.com",
+    "skills": ["Python", "AWS"],
+    "experience": [{"company": "Acme", "role": "Engineer", "years": "2020-2023"}],
+    "education": [{"degree": "BSc CS", "institution": "XYZ University", "years": "2016-2020"}],
+    "projects": [{"name": "Cool App", "description": "Built X", "tech": ["React", "FastAPI"]}],
+}).decode()
+
+_PROMPT_PREFIX = (
+    "You are a resume extraction engine. "
+    "Given resume content (as raw text or a JSON dump), "
+    "produce STRICT JSON only matching this shape:\n"
+    + _SCHEMA_HINT_JSON
+)
+
+
+# Successful Gemini extractions keyed by a digest of the input text, so
+# re-submitted resumes skip the network round-trip. Per process. Entries are
+# stored as orjson bytes so every hit decodes a fresh dict that callers can
+# mutate without touching the cache.
+_GEMINI_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_GEMINI_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(raw_text: str) -> bytes:
+    return hashlib.blake2b(raw_text.encode(), digest_size=16).digest()
+
+
+def _cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    with _GEMINI_CACHE_LOCK:
+        blob = _GEMINI_CACHE.get(key)
+    return None if blob is None else orjson.loads(blob)
+
+
+def _cache_put(key: bytes, result: Dict[str, Any]) -> None:
+    try:
+        blob = orjson.dumps(result)
+    except TypeError:
+        # orjson.JSONEncodeError (e.g. a >64-bit integer); just don't cache.
+        return
+    with _GEMINI_CACHE_LOCK:
+        _GEMINI_CACHE[key] = blob
+
+
+# Ask for a bare JSON body so responses usually parse without brace hunting.
+_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+
+def _extract_json(text: str, kind: type = dict) -> Any:
+    """Pull a JSON object (or, with ``kind=list``, an array) out of a response.
+
+    Bare-JSON responses are parsed as-is; otherwise the outermost ``{...}`` /
+    ``[...]`` span is cut out of any surrounding prose or code fences.
+    Returns ``None`` when no value of the requested kind can be recovered.
+    """
+    data = _safe_json_loads(text)
+    if not isinstance(data, kind):
+        open_char, close_char = ("{", "}") if kind is dict else ("[", "]")
+        start, end = text.find(open_char), text.rfind(close_char)
+        if start == -1 or end == -1 or end <= start:
+            return None
+        data = _safe_json_loads(text[start:end+1])
+    return data if isinstance(data, kind) else None
+
+
+# Characters that can change the bracket/string state of a JSON document;
+# everything in between is skipped by the regex engine.
+_JSON_STRUCTURE_RE = re.compile(r'[][{}"\\]')
+
+
+class _JsonSpanScanner:
+    """Locate the first balanced JSON object (or array) in chunked text.
+
+    ``feed`` returns the complete span as soon as its closing bracket
+    arrives, ignoring brackets inside strings, so a streamed response can
+    be abandoned before any trailing prose. ``text`` is everything fed.
+    """
+
+    def __init__(self, kind: type = dict) -> None:
+        self._opener = "{" if kind is dict else "["
+        self._parts: List[str] = []
+        self._length = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = -1  # index of the character after a backslash
+        self._done = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> Optional[str]:
+        base = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        if self._done:
+            return None
+        for match in _JSON_STRUCTURE_RE.finditer(chunk):
+            index = base + match.start()
+            char = match.group()
+            if self._start == -1:
+                if char == self._opener:
+                    self._start, self._depth = index, 1
+            elif index == self._escaped:
+                continue
+            elif self._in_string:
+                if char == "\\":
+                    self._escaped = index + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    return self.text[self._start:index + 1]
+        return None
+
+
+def _chunk_text(chunk: Any) -> str:
+    # A streamed chunk without text parts (e.g. a bare finish reason) raises.
+    try:
+        return chunk.text
+    except Exception:
+        return ""
+
+
+def _cancel_stream(response: Any) -> None:
+    """Cancel the RPC behind a streamed SDK response.
+
+    The SDK keeps the transport stream on its private ``_iterator``; gRPC
+    calls (sync and asyncio) expose ``cancel()``, a no-op once finished.
+    """
+    cancel = getattr(getattr(response, "_iterator", None), "cancel", None)
+    if callable(cancel):
+        try:
+            cancel()
+        except Exception as exc:
+            logger.debug("Failed to cancel Gemini stream: %s", exc)
+
+
+def _read_json_stream(response: Any, kind: type = dict) -> Any:
+    """Consume a streamed response only until its first JSON value parses.
+
+    The stream is closed and its RPC cancelled on the way out. Falls back to
+    ``_extract_json`` over the full text when the first balanced span isn't
+    valid JSON of the requested kind.
+    """
+    scanner = _JsonSpanScanner(kind)
+    chunks = iter(response)
+    try:
+        for chunk in chunks:
+            span = scanner.feed(_chunk_text(chunk))
+            if span is not None:
+                data = _safe_json_loads(span)
+                if isinstance(data, kind):
+                    return data
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+        _cancel_stream(response)
+    return _extract_json(scanner.text, kind)
+
+
+async def _read_json_stream_async(response: Any, kind: type = dict) -> Any:
+    """Async twin of ``_read_json_stream``."""
+    scanner = _JsonSpanScanner(kind)
+    chunks = aiter(response)
+    try:
+        async for chunk in chunks:
+            span = scanner.feed(_chunk_text(chunk))
+            if span is not None:
+                data = _safe_json_loads(span)
+                if isinstance(data, kind):
+                    return data
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        _cancel_stream(response)
+    return _extract_json(scanner.text, kind)
+
+
+def _init_gemini_model() -> Any:
+    """Configure the SDK and build the model once; ``None`` if unavailable."""
     api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     model_id = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
     if not api_key or genai is None:
+        return None
+    try:
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(model_id)
+    except Exception as exc:
+        logger.exception("Gemini setup failed: %s", exc)
+        return None
+
+
+_GEMINI_MODEL = _init_gemini_model()
+
+
+def _single_prompt(raw_text: str) -> List[str]:
+    return [_PROMPT_PREFIX, f"INPUT:\n{raw_text}\n\nOUTPUT JSON:"]
+
+
+def _shape_response(key: bytes, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if data is None:
+        return None
+    result = _ensure_shape(data)
+    _cache_put(key, result)
+    return result
+
+
+def _call_gemini(raw_text: str) -> Dict[str, Any]:
+    if _GEMINI_MODEL is None:
         return {"raw_text": raw_text}
 
+    key = _cache_key(raw_text)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_id)
-
-        schema_hint = {
-            "name": "John Doe",
-            "email": "john@example.com",
-            "skills": ["Python", "AWS"],
-            "experience": [{"company": "Acme", "role": "Engineer", "years": "2020-2023"}],
-            "education": [{"degree": "BSc CS", "institution": "XYZ University", "years": "2016-2020"}],
-            "projects": [{"name": "Cool App", "description": "Built X", "tech": ["React", "FastAPI"]}],
-        }
+        response = _GEMINI_MODEL.generate_content(
+            _single_prompt(raw_text),
+            generation_config=_GENERATION_CONFIG,
+            stream=True,
+        )
+        result = _shape_response(key, _read_json_stream(response))
+        if result is not None:
+            return result
+    except Exception as exc:
+        logger.exception("Gemini call failed: %s", exc)
+
+    return {"raw_text": raw_text}
+
 
-        prompt = (
-            "You are a resume extraction engine. "
-            "Given resume content (as raw text or a JSON dump), "
-            "produce STRICT JSON only matching this shape:\n"
-            + json.dumps(schema_hint)
+async def _call_gemini_async(raw_text: str) -> Dict[str, Any]:
+    """Async twin of ``_call_gemini`` for use on the event loop."""
+    if _GEMINI_MODEL is None:
+        return {"raw_text": raw_text}
+
+    key = _cache_key(raw_text)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await _GEMINI_MODEL.generate_content_async(
+            _single_prompt(raw_text),
+            generation_config=_GENERATION_CONFIG,
+            stream=True,
         )
-        request = f"INPUT:\n{raw_text}\n\nOUTPUT JSON:"
-
-        response = model.generate_content([prompt, request])
-        text = getattr(response, "text", "")
-        start, end = text.find("{"), text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            candidate = text[start:end+1]
-            data = _safe_json_loads(candidate)
-            if isinstance(data, dict):
-                return _ensure_shape(data)
+        result = _shape_response(key, await _read_json_stream_async(response))
+        if result is not None:
+            return result
     except Exception as exc:
         logger.exception("Gemini call failed: %s", exc)
 
@@ -174,37 +487,283 @@ def _call_gemini(raw_text: str) -> Dict[str, Any]:
 
 
 # ----------------------------
-# MCP Tool
+# Gemini request batching
 # ----------------------------
-@mcp.tool()
-def parse_resume(raw_text: str) -> Dict[str, Any]:
+# Off by default: a batch puts different callers' resumes (PII) in one
+# prompt, so only enable it when every REST caller is the same tenant.
+# A size of 1 sends each resume on its own and never waits.
+_BATCH_MAX_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "1"))
+_BATCH_MAX_WAIT = int(os.getenv("GEMINI_BATCH_WAIT_MS", "50")) / 1000
+
+_BATCH_PROMPT_PREFIX = (
+    "You are a resume extraction engine. "
+    "You will be given several resumes (as raw text or JSON dumps), each "
+    "wrapped in <<<RESUME n>>> ... <<<END n>>> markers. "
+    "Produce a STRICT JSON array only, with exactly one object per resume. "
+    "Each object must carry an integer \"id\" field equal to that resume's n "
+    "and otherwise match this shape:\n"
+    + _SCHEMA_HINT_JSON
+)
+
+
+def _match_batch_items(items: Optional[List[Any]], count: int) -> Optional[List[Dict[str, Any]]]:
+    """Map batched results back to their inputs by ``id``.
+
+    Returns ``None`` unless every input 1..count has exactly one object.
+    """
+    if items is None or len(items) != count:
+        return None
+    matched: List[Optional[Dict[str, Any]]] = [None] * count
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        index = item.get("id")
+        if type(index) is not int or not 1 <= index <= count or matched[index - 1] is not None:
+            return None
+        matched[index - 1] = item
+    return matched
+
+
+async def _call_gemini_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """Extract several resumes with one Gemini call.
+
+    Results are matched to inputs by their ``id`` and never cached, since a
+    model mix-up would otherwise pin one caller's data under another's key.
+    Falls back to one call per resume on any mismatch.
+    """
+    request = "\n\n".join(
+        f"<<<RESUME {index}>>>\n{text}\n<<<END {index}>>>"
+        for index, text in enumerate(texts, 1)
+    )
+    try:
+        response = await _GEMINI_MODEL.generate_content_async(
+            [_BATCH_PROMPT_PREFIX, f"{request}\n\nOUTPUT JSON ARRAY:"],
+            generation_config=_GENERATION_CONFIG,
+            stream=True,
+        )
+        matched = _match_batch_items(await _read_json_stream_async(response, list), len(texts))
+    except Exception as exc:
+        logger.exception("Batched Gemini call failed: %s", exc)
+        matched = None
+
+    if matched is None:
+        logger.warning(
+            "Batched Gemini response unusable for %d resumes; retrying individually",
+            len(texts),
+        )
+        return list(await asyncio.gather(*(_call_gemini_async(text) for text in texts)))
+
+    return [_ensure_shape(item) for item in matched]
+
+
+class _GeminiBatcher:
+    """Coalesce concurrent Gemini requests into batched prompts.
+
+    Callers enqueue their text and await a future. A background task takes
+    up to ``max_size`` queued texts, waiting at most ``max_wait`` seconds
+    after the first, and resolves every future from a single model call.
+    """
+
+    def __init__(self, max_size: int, max_wait: float) -> None:
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def submit(self, raw_text: str) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The queue and worker belong to the loop that built them; a new
+            # loop (another asyncio.run, a test client, a reload) gets fresh ones.
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+            self._in_flight = set()
+        future = loop.create_future()
+        self._queue.put_nowait((raw_text, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Cancel the worker and any in-flight batches on the current loop."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        tasks = [self._worker, *self._in_flight]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._loop = self._queue = self._worker = None
+        self._in_flight = set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without awaiting so the next batch can start filling.
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            if len(texts) == 1:
+                results = [await _call_gemini_async(texts[0])]
+            else:
+                results = await _call_gemini_batch(texts)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            logger.exception("Gemini batch dispatch failed: %s", exc)
+            results = [{"raw_text": text} for text in texts]
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_GEMINI_BATCHER = _GeminiBatcher(_BATCH_MAX_SIZE, _BATCH_MAX_WAIT)
+
+
+async def _call_gemini_batched(raw_text: str) -> Dict[str, Any]:
+    """Like ``_call_gemini_async``, but shares the model call with other requests."""
+    if _GEMINI_MODEL is None:
+        return {"raw_text": raw_text}
+    cached = _cache_get(_cache_key(raw_text))
+    if cached is not None:
+        return cached
+    return await _GEMINI_BATCHER.submit(raw_text)
+
+
+# Top-level keys that mark an input as an already-structured resume.
+_STRUCTURED_KEYS = frozenset(("skills", "experience", "education", "projects"))
+
+
+def _resolve_input(raw_text: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Decide how ``raw_text`` should be parsed.
+
+    Returns ``(result, "")`` when the input is already structured, or
+    ``(None, text)`` with the text that still has to go through Gemini.
+    """
     if raw_text is None:
-        return {"skills": [], "experience": [], "education": [], "projects": []}
+        return {"skills": [], "experience": [], "education": [], "projects": []}, ""
 
-    parsed = _safe_json_loads(raw_text)
-    if isinstance(parsed, dict):
+    parsed = _lazy_json_loads(raw_text)
+    if isinstance(parsed, _MAPPING_TYPES):
         text_payload = _find_text_payload(parsed)
         if text_payload:
-            return _call_gemini(text_payload)
-        if {"skills", "experience", "education", "projects"}.intersection(parsed):
-            return _ensure_shape(parsed)
-        return _call_gemini(raw_text)
+            return None, text_payload
+        if not _STRUCTURED_KEYS.isdisjoint(parsed.keys()):
+            if not isinstance(parsed, dict):
+                parsed = parsed.as_dict()
+            return _ensure_shape(parsed), ""
+
+    return None, raw_text
+
 
-    return _call_gemini(raw_text)
+# ----------------------------
+# MCP Tool
+# ----------------------------
+@mcp.tool()
+def parse_resume(raw_text: str) -> Dict[str, Any]:
+    result, text = _resolve_input(raw_text)
+    if result is not None:
+        return result
+    return _call_gemini(text)
 
 
 # ----------------------------
 # FastAPI Wrapper
 # ----------------------------
-app = FastAPI()
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    await _GEMINI_BATCHER.aclose()
+
+
+app = FastAPI(lifespan=_lifespan)
 
 class ResumeInput(BaseModel):
     raw_text: str
 
-@app.post("/parse_resume")
-async def parse_resume_api(data: ResumeInput):
+class _OrjsonResponse(JSONResponse):
+    """JSON response rendered by orjson.
+
+    Stands in for fastapi.responses.ORJSONResponse, which newer FastAPI
+    releases deprecate with a warning on every request.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. an integer wider than 64 bits that
+            # passed through _ensure_shape untouched.
+            return super().render(content)
+
+def _body_errors(exc: ValidationError, body: bytes) -> List[Dict[str, Any]]:
+    """Reshape ``model_validate_json`` errors into the ones FastAPI reports.
+
+    FastAPI decodes the body with stdlib json before validating, so a
+    missing body, malformed JSON and field errors each have their own shape.
+    """
+    if not body:
+        return [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+    errors = exc.errors(include_url=False)
+    if any(error["type"] == "json_invalid" for error in errors):
+        try:
+            json.loads(body)
+        except json.JSONDecodeError as decode_error:
+            return [{
+                "type": "json_invalid",
+                "loc": ("body", decode_error.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": decode_error.msg},
+            }]
+        except ValueError:
+            pass
+    return [{**error, "loc": ("body", *error["loc"])} for error in errors]
+
+# The body is validated straight from bytes by pydantic-core, so the route
+# takes the raw Request and documents the expected schema by hand.
+@app.post(
+    "/parse_resume",
+    response_class=_OrjsonResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": ResumeInput.model_json_schema()}},
+            "required": True,
+        },
+    },
+)
+async def parse_resume_api(request: Request):
     """REST wrapper around the MCP tool"""
-    return parse_resume(data.raw_text)
+    body = await request.body()
+    try:
+        data = ResumeInput.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(_body_errors(exc, body)) from exc
+    result, text = _resolve_input(data.raw_text)
+    if result is None:
+        result = await _call_gemini_batched(text)
+    # Returned as a Response so FastAPI skips jsonable_encoder; the result is
+    # already plain JSON types.
+    return _OrjsonResponse(result)
 
 
 # ----------------------------
@@ -215,4 +774,12 @@ if __name__ == "__main__":
     if mode == "mcp":
         mcp.run("streamable-http")   # MCP mode (for Coral/Claude)
     else:
-        uvicorn.run(app, host="127.0.0.1", port=9000)  # REST mode (for curl/frontend)
+        # REST mode (for curl/frontend). Workers need an import string; each
+        # one keeps its own Gemini cache. uvloop/httptools come from
+        # uvicorn[standard] and are picked up by uvicorn's "auto" defaults.
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=9000,
+            workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        )
@@ -0,0 +1,15 @@
+import main
+
+
+def test_bigint_input_falls_back_to_stdlib_json(monkeypatch):
+    # simdjson raises RuntimeError(BIGINT_ERROR) for integers wider than 64 bits.
+    monkeypatch.setattr(main, "_GEMINI_MODEL", None)
+    result = main.parse_resume('{"id": 123456789012345678901234567890, "skills": ["py"]}')
+    assert result["skills"] == ["py"]
+
+
+def test_deeply_nested_input_falls_back(monkeypatch):
+    # simdjson raises RuntimeError(DEPTH_ERROR) past its nesting limit.
+    monkeypatch.setattr(main, "_GEMINI_MODEL", None)
+    raw_text = "[" * 2000 + "]" * 2000
+    assert main.parse_resume(raw_text) == {"raw_text": raw_text}